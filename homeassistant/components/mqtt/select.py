@@ -2,7 +2,6 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-import functools
 import logging
 
 import voluptuous as vol
@@ -73,21 +72,14 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up MQTT select through YAML and through MQTT discovery."""
-    setup = functools.partial(
-        _async_setup_entity, hass, async_add_entities, config_entry=config_entry
-    )
-    await async_setup_entry_helper(hass, select.DOMAIN, setup, DISCOVERY_SCHEMA)
 
+    async def setup(
+        config: ConfigType, discovery_data: DiscoveryInfoType | None = None
+    ) -> None:
+        """Set up the MQTT select."""
+        async_add_entities([MqttSelect(hass, config, config_entry, discovery_data)])
 
-async def _async_setup_entity(
-    hass: HomeAssistant,
-    async_add_entities: AddEntitiesCallback,
-    config: ConfigType,
-    config_entry: ConfigEntry,
-    discovery_data: DiscoveryInfoType | None = None,
-) -> None:
-    """Set up the MQTT select."""
-    async_add_entities([MqttSelect(hass, config, config_entry, discovery_data)])
+    await async_setup_entry_helper(hass, select.DOMAIN, setup, DISCOVERY_SCHEMA)
 
 
 class MqttSelect(MqttEntity, SelectEntity, RestoreEntity):
@@ -99,6 +91,11 @@ class MqttSelect(MqttEntity, SelectEntity, RestoreEntity):
     _command_template: Callable[[PublishPayloadType], PublishPayloadType]
     _value_template: Callable[[ReceivePayloadType], ReceivePayloadType]
     _optimistic: bool = False
+    _options_set: frozenset[str]
+    _command_topic: str
+    _qos: int
+    _retain: bool
+    _encoding: str
 
     def __init__(
         self,
@@ -121,6 +118,11 @@ class MqttSelect(MqttEntity, SelectEntity, RestoreEntity):
         """(Re)Setup the entity."""
         self._attr_assumed_state = config[CONF_OPTIMISTIC]
         self._attr_options = config[CONF_OPTIONS]
+        self._options_set = frozenset(self._attr_options)
+        self._command_topic = config[CONF_COMMAND_TOPIC]
+        self._qos = config[CONF_QOS]
+        self._retain = config[CONF_RETAIN]
+        self._encoding = config[CONF_ENCODING]
 
         self._command_template = MqttCommandTemplate(
             config.get(CONF_COMMAND_TEMPLATE),
@@ -132,18 +134,24 @@ class MqttSelect(MqttEntity, SelectEntity, RestoreEntity):
 
     def _prepare_subscribe_topics(self) -> None:
         """(Re)Subscribe to topics."""
+        if self._config.get(CONF_STATE_TOPIC) is None:
+            # Force into optimistic mode.
+            self._attr_assumed_state = True
+            return
 
         @callback
         @log_messages(self.hass, self.entity_id)
         @write_state_on_attr_change(self, {"_attr_current_option"})
         def message_received(msg: ReceiveMessage) -> None:
             """Handle new MQTT messages."""
-            payload = str(self._value_template(msg.payload))
-            if payload.lower() == "none":
+            payload = self._value_template(msg.payload)
+            if not isinstance(payload, str):
+                payload = str(payload)
+            if len(payload) == 4 and payload.lower() == "none":
                 self._attr_current_option = None
                 return
 
-            if payload not in self.options:
+            if payload not in self._options_set:
                 _LOGGER.error(
                     "Invalid option for %s: '%s' (valid options: %s)",
                     self.entity_id,
@@ -153,22 +161,18 @@ class MqttSelect(MqttEntity, SelectEntity, RestoreEntity):
                 return
             self._attr_current_option = payload
 
-        if self._config.get(CONF_STATE_TOPIC) is None:
-            # Force into optimistic mode.
-            self._attr_assumed_state = True
-        else:
-            self._sub_state = subscription.async_prepare_subscribe_topics(
-                self.hass,
-                self._sub_state,
-                {
-                    "state_topic": {
-                        "topic": self._config.get(CONF_STATE_TOPIC),
-                        "msg_callback": message_received,
-                        "qos": self._config[CONF_QOS],
-                        "encoding": self._config[CONF_ENCODING] or None,
-                    }
-                },
-            )
+        self._sub_state = subscription.async_prepare_subscribe_topics(
+            self.hass,
+            self._sub_state,
+            {
+                "state_topic": {
+                    "topic": self._config.get(CONF_STATE_TOPIC),
+                    "msg_callback": message_received,
+                    "qos": self._qos,
+                    "encoding": self._encoding or None,
+                }
+            },
+        )
 
     async def _subscribe_topics(self) -> None:
         """(Re)Subscribe to topics."""
@@ -187,9 +191,5 @@ class MqttSelect(MqttEntity, SelectEntity, RestoreEntity):
             self.async_write_ha_state()
 
         await self.async_publish(
-            self._config[CONF_COMMAND_TOPIC],
-            payload,
-            self._config[CONF_QOS],
-            self._config[CONF_RETAIN],
-            self._config[CONF_ENCODING],
+            self._command_topic, payload, self._qos, self._retain, self._encoding
         )
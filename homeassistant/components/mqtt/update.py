@@ -1,9 +1,9 @@
 """Configure update platform in a device through MQTT topic."""
 from __future__ import annotations
 
-import functools
+from collections.abc import Callable
 import logging
-from typing import Any, TypedDict, cast
+from typing import TYPE_CHECKING, Any, TypedDict, cast
 
 import voluptuous as vol
 
@@ -39,7 +39,11 @@ from .mixins import (
     async_setup_entry_helper,
     write_state_on_attr_change,
 )
-from .models import MessageCallbackType, MqttValueTemplate, ReceiveMessage
+from .models import (
+    MqttValueTemplate,
+    ReceiveMessage,
+    ReceivePayloadType,
+)
 from .util import valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -75,6 +79,17 @@ PLATFORM_SCHEMA_MODERN = MQTT_RO_SCHEMA.extend(
 DISCOVERY_SCHEMA = vol.All(PLATFORM_SCHEMA_MODERN.extend({}, extra=vol.REMOVE_EXTRA))
 
 
+MQTT_UPDATE_JSON_ATTRIBUTES = {
+    "installed_version": "_attr_installed_version",
+    "latest_version": "_attr_latest_version",
+    "title": "_attr_title",
+    "release_summary": "_attr_release_summary",
+    "release_url": "_attr_release_url",
+    "entity_picture": "_entity_picture",
+}
+MQTT_UPDATE_TRACKED_ATTRIBUTES = set(MQTT_UPDATE_JSON_ATTRIBUTES.values())
+
+
 class _MqttUpdatePayloadType(TypedDict, total=False):
     """Presentation of supported JSON payload to process state updates."""
 
@@ -86,27 +101,56 @@ class _MqttUpdatePayloadType(TypedDict, total=False):
     entity_picture: str
 
 
+def _parse_update_payload(
+    payload: ReceivePayloadType, topic: str
+) -> _MqttUpdatePayloadType:
+    """Parse a rendered state payload into the supported update attributes."""
+    try:
+        rendered_json_payload = json_loads(payload)
+    except JSON_DECODE_EXCEPTIONS:
+        _LOGGER.debug(
+            (
+                "No valid (JSON) payload detected after processing payload '%s'"
+                " on topic %s"
+            ),
+            payload,
+            topic,
+        )
+        return {"installed_version": str(payload)}
+
+    if not isinstance(rendered_json_payload, dict):
+        _LOGGER.debug(
+            (
+                "Non-dictionary JSON payload detected after processing"
+                " payload '%s' on topic %s"
+            ),
+            payload,
+            topic,
+        )
+        return {"installed_version": str(payload)}
+
+    _LOGGER.debug(
+        "JSON payload detected after processing payload '%s' on topic %s",
+        rendered_json_payload,
+        topic,
+    )
+    return cast(_MqttUpdatePayloadType, rendered_json_payload)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up MQTT update through YAML and through MQTT discovery."""
-    setup = functools.partial(
-        _async_setup_entity, hass, async_add_entities, config_entry=config_entry
-    )
-    await async_setup_entry_helper(hass, update.DOMAIN, setup, DISCOVERY_SCHEMA)
 
+    async def setup(
+        config: ConfigType, discovery_data: DiscoveryInfoType | None = None
+    ) -> None:
+        """Set up the MQTT update."""
+        async_add_entities([MqttUpdate(hass, config, config_entry, discovery_data)])
 
-async def _async_setup_entity(
-    hass: HomeAssistant,
-    async_add_entities: AddEntitiesCallback,
-    config: ConfigType,
-    config_entry: ConfigEntry,
-    discovery_data: DiscoveryInfoType | None = None,
-) -> None:
-    """Set up the MQTT update."""
-    async_add_entities([MqttUpdate(hass, config, config_entry, discovery_data)])
+    await async_setup_entry_helper(hass, update.DOMAIN, setup, DISCOVERY_SCHEMA)
 
 
 class MqttUpdate(MqttEntity, UpdateEntity, RestoreEntity):
@@ -114,6 +158,12 @@ class MqttUpdate(MqttEntity, UpdateEntity, RestoreEntity):
 
     _default_name = DEFAULT_NAME
     _entity_id_format = update.ENTITY_ID_FORMAT
+    _command_topic: str | None
+    _qos: int
+    _retain: bool
+    _encoding: str
+    _value_template: Callable[[ReceivePayloadType], ReceivePayloadType] | None
+    _latest_version_template: Callable[[ReceivePayloadType], ReceivePayloadType]
 
     def __init__(
         self,
@@ -148,124 +198,78 @@ class MqttUpdate(MqttEntity, UpdateEntity, RestoreEntity):
 
     def _setup_from_config(self, config: ConfigType) -> None:
         """(Re)Setup the entity."""
-        self._templates = {
-            CONF_VALUE_TEMPLATE: MqttValueTemplate(
-                config.get(CONF_VALUE_TEMPLATE),
-                entity=self,
-            ).async_render_with_possible_json_value,
-            CONF_LATEST_VERSION_TEMPLATE: MqttValueTemplate(
-                config.get(CONF_LATEST_VERSION_TEMPLATE),
+        self._value_template = None
+        if (value_template := config.get(CONF_VALUE_TEMPLATE)) is not None:
+            self._value_template = MqttValueTemplate(
+                value_template,
                 entity=self,
-            ).async_render_with_possible_json_value,
-        }
+            ).async_render_with_possible_json_value
+        self._latest_version_template = MqttValueTemplate(
+            config.get(CONF_LATEST_VERSION_TEMPLATE),
+            entity=self,
+        ).async_render_with_possible_json_value
+        self._command_topic = config.get(CONF_COMMAND_TOPIC)
+        self._attr_supported_features = UpdateEntityFeature(0)
+        if self._command_topic is not None:
+            self._attr_supported_features |= UpdateEntityFeature.INSTALL
+        self._qos = config[CONF_QOS]
+        self._retain = config[CONF_RETAIN]
+        self._encoding = config[CONF_ENCODING]
 
     def _prepare_subscribe_topics(self) -> None:
         """(Re)Subscribe to topics."""
+        encoding = self._encoding or None
         topics: dict[str, Any] = {}
 
-        def add_subscription(
-            topics: dict[str, Any], topic: str, msg_callback: MessageCallbackType
-        ) -> None:
-            if self._config.get(topic) is not None:
-                topics[topic] = {
-                    "topic": self._config[topic],
-                    "msg_callback": msg_callback,
-                    "qos": self._config[CONF_QOS],
-                    "encoding": self._config[CONF_ENCODING] or None,
-                }
-
-        @callback
-        @log_messages(self.hass, self.entity_id)
-        @write_state_on_attr_change(
-            self,
-            {
-                "_attr_installed_version",
-                "_attr_latest_version",
-                "_attr_title",
-                "_attr_release_summary",
-                "_attr_release_url",
-                "_entity_picture",
-            },
-        )
-        def handle_state_message_received(msg: ReceiveMessage) -> None:
-            """Handle receiving state message via MQTT."""
-            payload = self._templates[CONF_VALUE_TEMPLATE](msg.payload)
-
-            if not payload or payload == PAYLOAD_EMPTY_JSON:
-                _LOGGER.debug(
-                    "Ignoring empty payload '%s' after rendering for topic %s",
-                    payload,
-                    msg.topic,
-                )
-                return
-
-            json_payload: _MqttUpdatePayloadType = {}
-            try:
-                rendered_json_payload = json_loads(payload)
-                if isinstance(rendered_json_payload, dict):
-                    _LOGGER.debug(
-                        (
-                            "JSON payload detected after processing payload '%s' on"
-                            " topic %s"
-                        ),
-                        rendered_json_payload,
-                        msg.topic,
-                    )
-                    json_payload = cast(_MqttUpdatePayloadType, rendered_json_payload)
-                else:
+        if (state_topic := self._config.get(CONF_STATE_TOPIC)) is not None:
+            @callback
+            @log_messages(self.hass, self.entity_id)
+            @write_state_on_attr_change(self, MQTT_UPDATE_TRACKED_ATTRIBUTES)
+            def handle_state_message_received(msg: ReceiveMessage) -> None:
+                """Handle receiving state message via MQTT."""
+                payload = msg.payload
+                if self._value_template is not None:
+                    payload = self._value_template(payload)
+
+                if not payload or payload == PAYLOAD_EMPTY_JSON:
                     _LOGGER.debug(
-                        (
-                            "Non-dictionary JSON payload detected after processing"
-                            " payload '%s' on topic %s"
-                        ),
+                        "Ignoring empty payload '%s' after rendering for topic %s",
                         payload,
                         msg.topic,
                     )
-                    json_payload = {"installed_version": str(payload)}
-            except JSON_DECODE_EXCEPTIONS:
-                _LOGGER.debug(
-                    (
-                        "No valid (JSON) payload detected after processing payload '%s'"
-                        " on topic %s"
-                    ),
-                    payload,
-                    msg.topic,
-                )
-                json_payload["installed_version"] = str(payload)
-
-            if "installed_version" in json_payload:
-                self._attr_installed_version = json_payload["installed_version"]
-
-            if "latest_version" in json_payload:
-                self._attr_latest_version = json_payload["latest_version"]
-
-            if "title" in json_payload:
-                self._attr_title = json_payload["title"]
-
-            if "release_summary" in json_payload:
-                self._attr_release_summary = json_payload["release_summary"]
-
-            if "release_url" in json_payload:
-                self._attr_release_url = json_payload["release_url"]
-
-            if "entity_picture" in json_payload:
-                self._entity_picture = json_payload["entity_picture"]
-
-        add_subscription(topics, CONF_STATE_TOPIC, handle_state_message_received)
-
-        @callback
-        @log_messages(self.hass, self.entity_id)
-        @write_state_on_attr_change(self, {"_attr_latest_version"})
-        def handle_latest_version_received(msg: ReceiveMessage) -> None:
-            """Handle receiving latest version via MQTT."""
-            latest_version = self._templates[CONF_LATEST_VERSION_TEMPLATE](msg.payload)
-
-            if isinstance(latest_version, str) and latest_version != "":
-                self._attr_latest_version = latest_version
-
-        add_subscription(
-            topics, CONF_LATEST_VERSION_TOPIC, handle_latest_version_received
-        )
+                    return
+
+                json_payload = _parse_update_payload(payload, msg.topic)
+                for key, value in json_payload.items():
+                    if (attribute := MQTT_UPDATE_JSON_ATTRIBUTES.get(key)) is not None:
+                        setattr(self, attribute, value)
+
+            topics[CONF_STATE_TOPIC] = {
+                "topic": state_topic,
+                "msg_callback": handle_state_message_received,
+                "qos": self._qos,
+                "encoding": encoding,
+            }
+
+        if (
+            latest_version_topic := self._config.get(CONF_LATEST_VERSION_TOPIC)
+        ) is not None:
+            @callback
+            @log_messages(self.hass, self.entity_id)
+            @write_state_on_attr_change(self, {"_attr_latest_version"})
+            def handle_latest_version_received(msg: ReceiveMessage) -> None:
+                """Handle receiving latest version via MQTT."""
+                latest_version = self._latest_version_template(msg.payload)
+
+                if isinstance(latest_version, str) and latest_version != "":
+                    self._attr_latest_version = latest_version
+
+            topics[CONF_LATEST_VERSION_TOPIC] = {
+                "topic": latest_version_topic,
+                "msg_callback": handle_latest_version_received,
+                "qos": self._qos,
+                "encoding": encoding,
+            }
 
         self._sub_state = subscription.async_prepare_subscribe_topics(
             self.hass, self._sub_state, topics
@@ -279,22 +283,14 @@ class MqttUpdate(MqttEntity, UpdateEntity, RestoreEntity):
         self, version: str | None, backup: bool, **kwargs: Any
     ) -> None:
         """Update the current value."""
-        payload = self._config[CONF_PAYLOAD_INSTALL]
-
+        # The install service requires UpdateEntityFeature.INSTALL, which is
+        # only supported when a command topic is configured.
+        if TYPE_CHECKING:
+            assert self._command_topic is not None
         await self.async_publish(
-            self._config[CONF_COMMAND_TOPIC],
-            payload,
-            self._config[CONF_QOS],
-            self._config[CONF_RETAIN],
-            self._config[CONF_ENCODING],
+            self._command_topic,
+            self._config[CONF_PAYLOAD_INSTALL],
+            self._qos,
+            self._retain,
+            self._encoding,
         )
-
-    @property
-    def supported_features(self) -> UpdateEntityFeature:
-        """Return the list of supported features."""
-        support = UpdateEntityFeature(0)
-
-        if self._config.get(CONF_COMMAND_TOPIC) is not None:
-            support |= UpdateEntityFeature.INSTALL
-
-        return support
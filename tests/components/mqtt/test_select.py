@@ -122,6 +122,33 @@ async def test_run_select_setup(
     assert state.state == "beer"
 
 
+@pytest.mark.parametrize(
+    ("hass_config", "topic"),
+    _test_run_select_setup_params("test/select_stat"),
+)
+@pytest.mark.parametrize("payload", ["none", "None", "NONE", "nOnE"])
+async def test_none_payload_resets_option(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    topic: str,
+    payload: str,
+) -> None:
+    """Test that a none payload resets the current option."""
+    await mqtt_mock_entry()
+
+    async_fire_mqtt_message(hass, topic, "milk")
+    await hass.async_block_till_done()
+
+    state = hass.states.get("select.test_select")
+    assert state.state == "milk"
+
+    async_fire_mqtt_message(hass, topic, payload)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("select.test_select")
+    assert state.state == STATE_UNKNOWN
+
+
 @pytest.mark.parametrize(
     "hass_config",
     [
@@ -510,6 +537,46 @@ async def test_discovery_update_select(
     )
 
 
+async def test_discovery_update_select_options(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the valid options are updated with the discovered select."""
+    config1 = {
+        "name": "Beer",
+        "state_topic": "test-topic",
+        "command_topic": "test-topic",
+        "options": ["milk", "beer"],
+    }
+    config2 = {
+        "name": "Milk",
+        "state_topic": "test-topic",
+        "command_topic": "test-topic",
+        "options": ["milk", "wine"],
+    }
+
+    state_data1 = [
+        ([("test-topic", "beer")], "beer", [(ATTR_OPTIONS, ["milk", "beer"])]),
+        ([("test-topic", "wine")], "beer", None),
+    ]
+    state_data2 = [
+        ([("test-topic", "wine")], "wine", [(ATTR_OPTIONS, ["milk", "wine"])]),
+        ([("test-topic", "beer")], "wine", None),
+    ]
+
+    await help_test_discovery_update(
+        hass,
+        mqtt_mock_entry,
+        caplog,
+        select.DOMAIN,
+        config1,
+        config2,
+        state_data1=state_data1,
+        state_data2=state_data2,
+    )
+
+
 async def test_discovery_update_unchanged_select(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,